@@ -5,9 +5,10 @@ import sys
 import os
 sys.path.append(os.path.dirname(__file__))
 
+from sqlalchemy import select, update
 from sqlalchemy.orm import sessionmaker
 from app.db import engine
-from app import models, crud, schemas
+from app import models, crud
 
 def add_device_properties():
     """Add sample config properties to existing devices."""
@@ -33,26 +34,32 @@ def add_device_properties():
             {"riskLevel": "High", "vulnerabilities": "4", "complianceStatus": "Non-Compliant", "monitoringEnabled": "true", "department": "Support"}
         ]
         
+        updates = []
         for i, device in enumerate(devices):
             if not device.config or len(device.config) == 0:
                 # Add properties to devices that don't have any
                 config_to_add = sample_configs[i % len(sample_configs)]
+                updates.append({"id": device.id, "config": config_to_add})
                 
-                update_data = schemas.DeviceUpdate(config=config_to_add)
-                updated_device = crud.update_device(db, device, update_data)
-                
-                print(f"   ✅ Updated device {device.id} ({device.name}) with config: {config_to_add}")
+                print(f"   ✅ Updating device {device.id} ({device.name}) with config: {config_to_add}")
             else:
                 print(f"   ⏭️  Device {device.id} ({device.name}) already has config: {device.config}")
         
+        # Apply every update as one executemany and commit once
+        if updates:
+            db.execute(update(models.Device), updates)
+            db.commit()
+        
         print(f"\n🔍 Verifying updates...")
-        devices = crud.get_devices(db)
+        rows = db.execute(
+            select(models.Device.id, models.Device.config).order_by(models.Device.id)
+        )
         
         all_config_keys = set()
-        for device in devices:
-            if device.config:
-                all_config_keys.update(device.config.keys())
-                print(f"   Device {device.id}: {list(device.config.keys())}")
+        for device_id, config in rows:
+            if config:
+                all_config_keys.update(config.keys())
+                print(f"   Device {device_id}: {list(config.keys())}")
         
         print(f"\n📊 All config properties found: {sorted(all_config_keys)}")
         print(f"✅ Device properties added successfully!")
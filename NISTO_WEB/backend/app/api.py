@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import io
-from typing import List
+from typing import Any, List
 
 import pandas as pd
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from . import crud, models, schemas
@@ -34,12 +35,25 @@ def _calculate_risk_score(risk_level: str, vulnerability_count: int, connection_
     else:
         return 'Critical'
 
-router = APIRouter(prefix="/api", tags=["api"])
+router = APIRouter(prefix="/api", tags=["api"], default_response_class=ORJSONResponse)
+
+# List endpoints encode their rows in one pass through pydantic-core instead of
+# FastAPI's per-item validate -> jsonable_encoder -> json.dumps pipeline.
+_device_list_adapter = TypeAdapter(List[schemas.DeviceRead])
+_connection_list_adapter = TypeAdapter(List[schemas.ConnectionRead])
+_boundary_list_adapter = TypeAdapter(List[schemas.BoundaryRead])
+_project_list_adapter = TypeAdapter(List[schemas.ProjectSummary])
+
+
+def _list_response(adapter: TypeAdapter, rows: List[Any]) -> Response:
+    """Serialize ``rows`` with ``adapter`` straight to a JSON response."""
+    items = adapter.validate_python(rows, from_attributes=True)
+    return Response(content=adapter.dump_json(items), media_type="application/json")
 
 
 @router.get("/devices", response_model=List[schemas.DeviceRead])
-def list_devices(db: Session = Depends(get_db)) -> List[schemas.DeviceRead]:
-    return crud.get_devices(db)
+def list_devices(db: Session = Depends(get_db)) -> Response:
+    return _list_response(_device_list_adapter, crud.get_devices(db))
 
 
 @router.post(
@@ -80,8 +94,8 @@ def delete_device(device_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/connections", response_model=List[schemas.ConnectionRead])
-def list_connections(db: Session = Depends(get_db)) -> List[schemas.ConnectionRead]:
-    return crud.get_connections(db)
+def list_connections(db: Session = Depends(get_db)) -> Response:
+    return _list_response(_connection_list_adapter, crud.get_connections(db))
 
 
 @router.post(
@@ -137,12 +151,9 @@ def validate_connection_payload(
             detail="Connection cannot link a device to itself",
         )
 
-    for device_id in [connection.source_device_id, connection.target_device_id]:
-        if not crud.get_device(db, device_id):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Device {device_id} does not exist",
-            )
+    _ensure_devices_exist(
+        db, [connection.source_device_id, connection.target_device_id]
+    )
 
 
 def validate_connection_update_payload(
@@ -158,11 +169,26 @@ def validate_connection_update_payload(
             detail="Connection cannot link a device to itself",
         )
 
-    for device_id in [
-        connection_update.source_device_id,
-        connection_update.target_device_id,
-    ]:
-        if device_id is not None and not crud.get_device(db, device_id):
+    _ensure_devices_exist(
+        db,
+        [
+            device_id
+            for device_id in [
+                connection_update.source_device_id,
+                connection_update.target_device_id,
+            ]
+            if device_id is not None
+        ],
+    )
+
+
+def _ensure_devices_exist(db: Session, device_ids: List[int]) -> None:
+    """Raise 400 for the first device in ``device_ids`` that does not exist."""
+    if not device_ids:
+        return
+    existing_ids = crud.get_existing_device_ids(db, device_ids)
+    for device_id in device_ids:
+        if device_id not in existing_ids:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Device {device_id} does not exist",
@@ -172,8 +198,8 @@ def validate_connection_update_payload(
 # Boundary endpoints -----------------------------------------------------------
 
 @router.get("/boundaries", response_model=List[schemas.BoundaryRead])
-def list_boundaries(db: Session = Depends(get_db)) -> List[schemas.BoundaryRead]:
-    return crud.get_boundaries(db)
+def list_boundaries(db: Session = Depends(get_db)) -> Response:
+    return _list_response(_boundary_list_adapter, crud.get_boundaries(db))
 
 
 @router.post(
@@ -216,8 +242,8 @@ def delete_boundary(boundary_id: str, db: Session = Depends(get_db)):
 # Project endpoints ------------------------------------------------------------
 
 @router.get("/projects", response_model=List[schemas.ProjectSummary])
-def list_projects(db: Session = Depends(get_db)) -> List[schemas.ProjectSummary]:
-    return crud.get_projects(db)
+def list_projects(db: Session = Depends(get_db)) -> Response:
+    return _list_response(_project_list_adapter, crud.get_projects(db))
 
 
 @router.post(
@@ -269,12 +295,9 @@ def save_current_state(
 ):
     """Save the current devices and connections as a new project."""
     current_state = crud.get_current_state(db)
-    project = schemas.ProjectCreate(
-        name=project_create.name,
-        description=project_create.description,
-        project_data=current_state,
+    return crud.create_project_from_data(
+        db, project_create.name, project_create.description, current_state
     )
-    return crud.create_project(db, project)
 
 
 @router.post("/projects/{project_id}/load", status_code=status.HTTP_200_OK)
@@ -286,61 +309,7 @@ def load_project(project_id: int, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
         )
     
-    # Clear current data
-    for device in crud.get_devices(db):
-        crud.delete_device(db, device)
-    for boundary in crud.get_boundaries(db):
-        crud.delete_boundary(db, boundary)
-    
-    # Load project devices, connections, and boundaries
-    project_data = db_project.project_data
-    device_mapping = {}  # old_id -> new_id
-    
-    # Create devices
-    for device_data in project_data.get("devices", []):
-        old_id = device_data["id"]
-        device_create = schemas.DeviceCreate(
-            name=device_data["name"],
-            type=device_data["type"],
-            x=device_data.get("x"),
-            y=device_data.get("y"),
-            config=device_data.get("config", {}),
-        )
-        new_device = crud.create_device(db, device_create)
-        device_mapping[old_id] = new_device.id
-    
-    # Create connections
-    for conn_data in project_data.get("connections", []):
-        if (
-            conn_data["source_device_id"] in device_mapping
-            and conn_data["target_device_id"] in device_mapping
-        ):
-            connection_create = schemas.ConnectionCreate(
-                source_device_id=device_mapping[conn_data["source_device_id"]],
-                target_device_id=device_mapping[conn_data["target_device_id"]],
-                link_type=conn_data["link_type"],
-                properties=conn_data.get("properties", {}),
-            )
-            crud.create_connection(db, connection_create)
-    
-    # Create boundaries
-    for boundary_data in project_data.get("boundaries", []):
-        boundary_create = schemas.BoundaryCreate(
-            id=boundary_data["id"],
-            type=boundary_data["type"],
-            label=boundary_data["label"],
-            points=boundary_data["points"],
-            closed=boundary_data.get("closed", True),
-            style=boundary_data["style"],
-            created=boundary_data["created"],
-            x=boundary_data.get("x"),
-            y=boundary_data.get("y"),
-            width=boundary_data.get("width"),
-            height=boundary_data.get("height"),
-            config=boundary_data.get("config", {}),
-        )
-        crud.create_boundary(db, boundary_create)
-    
+    crud.restore_state(db, db_project.project_data)
     return {"message": "Project loaded successfully"}
 
 
@@ -360,62 +329,7 @@ def load_auto_save(db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND, detail="No auto-save found"
         )
     
-    # Use the same logic as load_project
-    # Clear current data
-    for device in crud.get_devices(db):
-        crud.delete_device(db, device)
-    for boundary in crud.get_boundaries(db):
-        crud.delete_boundary(db, boundary)
-    
-    # Load project devices, connections, and boundaries
-    project_data = auto_save.project_data
-    device_mapping = {}  # old_id -> new_id
-    
-    # Create devices
-    for device_data in project_data.get("devices", []):
-        old_id = device_data["id"]
-        device_create = schemas.DeviceCreate(
-            name=device_data["name"],
-            type=device_data["type"],
-            x=device_data.get("x"),
-            y=device_data.get("y"),
-            config=device_data.get("config", {}),
-        )
-        new_device = crud.create_device(db, device_create)
-        device_mapping[old_id] = new_device.id
-    
-    # Create connections
-    for conn_data in project_data.get("connections", []):
-        if (
-            conn_data["source_device_id"] in device_mapping
-            and conn_data["target_device_id"] in device_mapping
-        ):
-            connection_create = schemas.ConnectionCreate(
-                source_device_id=device_mapping[conn_data["source_device_id"]],
-                target_device_id=device_mapping[conn_data["target_device_id"]],
-                link_type=conn_data["link_type"],
-                properties=conn_data.get("properties", {}),
-            )
-            crud.create_connection(db, connection_create)
-    
-    # Create boundaries
-    for boundary_data in project_data.get("boundaries", []):
-        boundary_create = schemas.BoundaryCreate(
-            id=boundary_data["id"],
-            type=boundary_data["type"],
-            label=boundary_data["label"],
-            points=boundary_data["points"],
-            closed=boundary_data.get("closed", True),
-            style=boundary_data["style"],
-            created=boundary_data["created"],
-            x=boundary_data.get("x"),
-            y=boundary_data.get("y"),
-            width=boundary_data.get("width"),
-            height=boundary_data.get("height"),
-            config=boundary_data.get("config", {}),
-        )
-        crud.create_boundary(db, boundary_create)
-    
+    crud.restore_state(db, auto_save.project_data)
     return {"message": "Auto-save loaded successfully"}
 
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 
+from sqlalchemy import delete, func, insert
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
 
 from . import models, schemas
 
@@ -16,7 +18,15 @@ def get_devices(db: Session) -> List[models.Device]:
 
 
 def get_device(db: Session, device_id: int) -> Optional[models.Device]:
-    return db.query(models.Device).filter(models.Device.id == device_id).first()
+    # Session.get answers from the identity map when the device is already
+    # loaded in this request's session, skipping the SELECT.
+    return db.get(models.Device, device_id)
+
+
+def get_existing_device_ids(db: Session, device_ids: Iterable[int]) -> Set[int]:
+    """Return the subset of ``device_ids`` that exist, using a single query."""
+    rows = db.query(models.Device.id).filter(models.Device.id.in_(set(device_ids)))
+    return {row.id for row in rows}
 
 
 def create_device(db: Session, device: schemas.DeviceCreate) -> models.Device:
@@ -50,11 +60,7 @@ def get_connections(db: Session) -> List[models.Connection]:
 
 
 def get_connection(db: Session, connection_id: int) -> Optional[models.Connection]:
-    return (
-        db.query(models.Connection)
-        .filter(models.Connection.id == connection_id)
-        .first()
-    )
+    return db.get(models.Connection, connection_id)
 
 
 def create_connection(
@@ -92,7 +98,7 @@ def get_boundaries(db: Session) -> List[models.Boundary]:
 
 
 def get_boundary(db: Session, boundary_id: str) -> Optional[models.Boundary]:
-    return db.query(models.Boundary).filter(models.Boundary.id == boundary_id).first()
+    return db.get(models.Boundary, boundary_id)
 
 
 def create_boundary(db: Session, boundary: schemas.BoundaryCreate) -> models.Boundary:
@@ -121,29 +127,35 @@ def delete_boundary(db: Session, db_boundary: models.Boundary) -> None:
 
 # Project CRUD -----------------------------------------------------------------
 
+def _project_data_length(key: str) -> ColumnElement[int]:
+    """SQL expression counting the entries of ``project_data[key]``."""
+    return func.coalesce(
+        func.json_array_length(models.Project.project_data, f"$.{key}"), 0
+    )
+
+
 def get_projects(db: Session) -> List[schemas.ProjectSummary]:
-    projects = db.query(models.Project).order_by(models.Project.updated_at.desc()).all()
-    result = []
-    for project in projects:
-        device_count = len(project.project_data.get("devices", []))
-        connection_count = len(project.project_data.get("connections", []))
-        result.append(
-            schemas.ProjectSummary(
-                id=project.id,
-                name=project.name,
-                description=project.description,
-                created_at=project.created_at,
-                updated_at=project.updated_at,
-                is_auto_save=project.is_auto_save,
-                device_count=device_count,
-                connection_count=connection_count,
-            )
+    # Count devices and connections in SQL so the project_data blobs are never
+    # loaded just to be measured.
+    rows = (
+        db.query(
+            models.Project.id,
+            models.Project.name,
+            models.Project.description,
+            models.Project.created_at,
+            models.Project.updated_at,
+            models.Project.is_auto_save,
+            _project_data_length("devices").label("device_count"),
+            _project_data_length("connections").label("connection_count"),
         )
-    return result
+        .order_by(models.Project.updated_at.desc())
+        .all()
+    )
+    return [schemas.ProjectSummary.model_validate(row) for row in rows]
 
 
 def get_project(db: Session, project_id: int) -> Optional[models.Project]:
-    return db.query(models.Project).filter(models.Project.id == project_id).first()
+    return db.get(models.Project, project_id)
 
 
 def get_auto_save_project(db: Session) -> Optional[models.Project]:
@@ -155,10 +167,22 @@ def get_auto_save_project(db: Session) -> Optional[models.Project]:
 
 
 def create_project(db: Session, project: schemas.ProjectCreate) -> models.Project:
+    return create_project_from_data(
+        db, project.name, project.description, project.project_data.model_dump()
+    )
+
+
+def create_project_from_data(
+    db: Session,
+    name: str,
+    description: Optional[str],
+    project_data: Dict[str, Any],
+) -> models.Project:
+    """Create a project from an already-serialized ``project_data`` dict."""
     db_project = models.Project(
-        name=project.name,
-        description=project.description,
-        project_data=project.project_data.model_dump(),
+        name=name,
+        description=description,
+        project_data=project_data,
         is_auto_save=False,
     )
     db.add(db_project)
@@ -187,13 +211,13 @@ def delete_project(db: Session, db_project: models.Project) -> None:
 
 
 def create_or_update_auto_save(
-    db: Session, project_data: schemas.ProjectData
+    db: Session, project_data: Dict[str, Any]
 ) -> models.Project:
     """Create or update the auto-save project."""
     auto_save = get_auto_save_project(db)
     
     if auto_save:
-        auto_save.project_data = project_data.model_dump()
+        auto_save.project_data = project_data
         db.commit()
         db.refresh(auto_save)
         return auto_save
@@ -201,7 +225,7 @@ def create_or_update_auto_save(
         db_project = models.Project(
             name="Auto Save",
             description="Automatically saved project",
-            project_data=project_data.model_dump(),
+            project_data=project_data,
             is_auto_save=True,
         )
         db.add(db_project)
@@ -210,16 +234,131 @@ def create_or_update_auto_save(
         return db_project
 
 
-def get_current_state(db: Session) -> schemas.ProjectData:
-    """Get current devices, connections, and boundaries as ProjectData."""
-    devices = get_devices(db)
-    connections = get_connections(db)
-    boundaries = get_boundaries(db)
-    
-    return schemas.ProjectData(
-        devices=[schemas.DeviceRead.model_validate(device) for device in devices],
-        connections=[schemas.ConnectionRead.model_validate(conn) for conn in connections],
-        boundaries=[schemas.BoundaryRead.model_validate(boundary) for boundary in boundaries],
-        ui_state=None,
-    )
-
+def get_current_state(db: Session) -> Dict[str, Any]:
+    """Get current devices, connections, and boundaries as ``ProjectData`` JSON.
+
+    The dicts are built directly from the ORM rows; the rows already satisfy
+    the read schemas, so a Pydantic validate/dump round-trip adds nothing.
+    """
+    return {
+        "devices": [
+            {
+                "id": device.id,
+                "name": device.name,
+                "type": device.type,
+                "x": device.x,
+                "y": device.y,
+                "config": device.config or {},
+            }
+            for device in get_devices(db)
+        ],
+        "connections": [
+            {
+                "id": conn.id,
+                "source_device_id": conn.source_device_id,
+                "target_device_id": conn.target_device_id,
+                "link_type": conn.link_type,
+                "properties": conn.properties or {},
+            }
+            for conn in get_connections(db)
+        ],
+        "boundaries": [
+            {
+                "id": boundary.id,
+                "type": boundary.type,
+                "label": boundary.label,
+                "points": boundary.points,
+                "closed": bool(boundary.closed),
+                "style": boundary.style,
+                "created": boundary.created,
+                "x": boundary.x,
+                "y": boundary.y,
+                "width": boundary.width,
+                "height": boundary.height,
+                "config": boundary.config or {},
+            }
+            for boundary in get_boundaries(db)
+        ],
+        "ui_state": None,
+    }
+
+
+def restore_state(db: Session, project_data: Dict[str, Any]) -> None:
+    """Replace current devices, connections, and boundaries with ``project_data``.
+
+    Existing rows are cleared with bulk DELETE statements and the new rows are
+    inserted as batched executemany calls, so the whole restore runs in a
+    single transaction with one commit. Rows are built straight from
+    ``project_data`` without re-running schema validation: blobs stored through
+    ``POST``/``PUT /projects`` are validated as ``ProjectData``, and
+    save-current/auto-save blobs come from ``get_current_state``, which copies
+    rows field for field that the Create/Update schemas validated on write.
+    """
+    # Clear current data in one statement per table instead of per row
+    db.execute(delete(models.Connection))
+    db.execute(delete(models.Device))
+    db.execute(delete(models.Boundary))
+
+    # Create devices with an INSERT ... RETURNING whose ids come back in the
+    # same order as the rows, so they can be paired with the saved ids. Backends
+    # without an insert sentinel (SQLite) run this row by row inside the batch.
+    device_entries = project_data.get("devices", [])
+    device_mapping = {}  # old_id -> new_id
+    if device_entries:
+        new_ids = db.scalars(
+            insert(models.Device).returning(
+                models.Device.id, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    "name": device_data["name"],
+                    "type": device_data["type"],
+                    "x": device_data.get("x"),
+                    "y": device_data.get("y"),
+                    "config": device_data.get("config", {}),
+                }
+                for device_data in device_entries
+            ],
+        )
+        device_mapping = {
+            device_data["id"]: new_id
+            for device_data, new_id in zip(device_entries, new_ids)
+        }
+
+    # Create connections between devices that were restored; no generated
+    # values are needed back, so this runs as a plain executemany
+    connection_rows = [
+        {
+            "source_device_id": device_mapping[conn_data["source_device_id"]],
+            "target_device_id": device_mapping[conn_data["target_device_id"]],
+            "link_type": conn_data["link_type"],
+            "properties": conn_data.get("properties", {}),
+        }
+        for conn_data in project_data.get("connections", [])
+        if conn_data["source_device_id"] in device_mapping
+        and conn_data["target_device_id"] in device_mapping
+    ]
+    if connection_rows:
+        db.execute(insert(models.Connection), connection_rows)
+
+    # Create boundaries; their ids come from the frontend
+    boundary_rows = [
+        {
+            "id": boundary_data["id"],
+            "type": boundary_data["type"],
+            "label": boundary_data["label"],
+            "points": boundary_data["points"],
+            "closed": boundary_data.get("closed", True),
+            "style": boundary_data["style"],
+            "created": boundary_data["created"],
+            "x": boundary_data.get("x"),
+            "y": boundary_data.get("y"),
+            "width": boundary_data.get("width"),
+            "height": boundary_data.get("height"),
+            "config": boundary_data.get("config", {}),
+        }
+        for boundary_data in project_data.get("boundaries", [])
+    ]
+    if boundary_rows:
+        db.execute(insert(models.Boundary), boundary_rows)
+    db.commit()
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import os
-from typing import Generator
+from typing import Any, Generator
 
+import orjson
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
@@ -15,12 +16,21 @@ sqlite_connect_args = {}
 if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
     sqlite_connect_args = {"check_same_thread": False}
 
+
+def _json_dumps(value: Any) -> str:
+    """Serialize JSON columns with orjson; the driver expects ``str``, not bytes."""
+
+    return orjson.dumps(value).decode()
+
+
 # SQLite needs ``check_same_thread=False`` for usage with FastAPI dependency injection
 # and routers that may run in multiple worker threads.
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args=sqlite_connect_args,
     future=True,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
@@ -11,6 +11,9 @@ from .db import Base, engine
 
 def create_app() -> FastAPI:
     Base.metadata.create_all(bind=engine)
+    # create_all skips indexes on tables that already exist; add any missing ones.
+    for index in models.Connection.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
 
     app = FastAPI(title="NISTO API", version="0.1.0")
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, Optional
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -40,6 +40,12 @@ class Device(Base):
 
 class Connection(Base):
     __tablename__ = "connections"
+    __table_args__ = (
+        # Covers lookups by source and by (source, target) pair; the separate
+        # target index keeps ON DELETE CASCADE from devices off a full scan.
+        Index("ix_conn_src_tgt", "source_device_id", "target_device_id"),
+        Index("ix_conn_tgt", "target_device_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     source_device_id: Mapped[int] = mapped_column(